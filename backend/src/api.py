@@ -1,12 +1,15 @@
+import json
 import os
-import shutil
 import yaml
 import traceback # NEW: To grab the exact error message
+from functools import lru_cache
 from fastapi import FastAPI, UploadFile, File, BackgroundTasks, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from datetime import datetime, timezone
 
+import pandas as pd
+
 import backend.src.core.transcribe as transcribe
 import backend.src.core.analyze_outputs as analyze_outputs
 from backend.src.utils.extract_audio import extract_audio_from_video
@@ -23,13 +26,19 @@ app.add_middleware(
 
 CONFIG_PATH = "backend/config/settings.yaml"
 
+@lru_cache(maxsize=4)
+def _read_config(full_path: str, mtime: float) -> dict:
+    # Keyed on mtime so edits to settings.yaml are picked up without a restart.
+    # Callers only read the returned dict; do not mutate it.
+    with open(full_path, "r") as f:
+        return yaml.safe_load(f)
+
 def load_config():
     # Fix for path issues: always look relative to project root
     base_path = os.getcwd()
     full_path = os.path.join(base_path, CONFIG_PATH)
     if os.path.exists(full_path):
-        with open(full_path, "r") as f:
-            return yaml.safe_load(f)
+        return _read_config(full_path, os.path.getmtime(full_path))
     # Fallback if config is missing
     return {"paths": {"output_dir": "backend/data/output"}}
 
@@ -67,7 +76,6 @@ def process_audio_task(file_path: str, job_dir: str, config: dict):
         
         # Save Success Report
         with open(os.path.join(job_dir, "sitrep.json"), "w") as f:
-            import json
             json.dump(report, f, indent=2)
             
         print(f"--- JOB SUCCESS: {job_dir} ---")
@@ -85,7 +93,6 @@ def process_audio_task(file_path: str, job_dir: str, config: dict):
         }
         
         with open(os.path.join(job_dir, "error.json"), "w") as f:
-            import json
             json.dump(error_data, f, indent=2)
 
 @app.post("/upload")
@@ -105,12 +112,21 @@ async def upload_audio(background_tasks: BackgroundTasks, file: UploadFile = Fil
     # Save uploaded file
     input_path = os.path.join(job_dir, "source_audio" + os.path.splitext(file.filename)[1])
     with open(input_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+        # Chunked awaits keep the event loop free while large uploads copy.
+        while chunk := await file.read(1024 * 1024):
+            buffer.write(chunk)
         
     background_tasks.add_task(process_audio_task, input_path, job_dir, config)
     
     return {"job_id": job_id, "status": "processing"}
 
+@lru_cache(maxsize=8)
+def _read_transcript(seg_path: str, mtime: float) -> list:
+    # Clients poll /status; parse each segments.csv version once instead of
+    # on every poll. Treat the returned records as read-only.
+    seg_df = pd.read_csv(seg_path)
+    return seg_df.to_dict(orient="records")
+
 @app.get("/status/{job_id}")
 def get_status(job_id: str):
     config = load_config()
@@ -123,22 +139,18 @@ def get_status(job_id: str):
     if os.path.exists(error_path):
         # Report the crash to frontend
         with open(error_path, "r") as f:
-            import json
             return json.load(f)
             
     if os.path.exists(sitrep_path):
         with open(sitrep_path, "r") as f:
-            import json
             data = json.load(f)
         
         # Load transcript if available
         transcript = []
         seg_path = os.path.join(job_dir, "segments.csv")
         if os.path.exists(seg_path):
-            import pandas as pd
             try:
-                seg_df = pd.read_csv(seg_path)
-                transcript = seg_df.to_dict(orient="records")
+                transcript = _read_transcript(seg_path, os.path.getmtime(seg_path))
             except:
                 pass
         
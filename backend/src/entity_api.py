@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-import json
 import uuid
 import shutil
 import tempfile
 import zipfile
 import time
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 import math
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import BackgroundTasks, Depends, FastAPI, File, Form, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
@@ -45,6 +46,8 @@ from backend.src.entity_indexing.schemas import (
 from backend.src.entity_indexing.search import find_similar_entities, parse_query
 from backend.src.entity_indexing.storage import (
     frames_index_path,
+    parse_json,
+    read_json,
     report_path,
     report_pdf_path,
     report_csv_path,
@@ -66,6 +69,10 @@ app.add_middleware(
 
 router = APIRouter(prefix="/api")
 
+# Upper bound on rows returned per page, so one request can't serialize a whole
+# library or frame index.
+MAX_PAGE_SIZE = 200
+
 
 def get_session():
     session = SessionLocal()
@@ -86,28 +93,118 @@ def health_check() -> dict:
     return {"status": "ok"}
 
 
+# Reused across searches so the embedding model loads once per process rather
+# than on every /api/search request.
+@lru_cache(maxsize=1)
+def _embedding_provider() -> EmbeddingProvider:
+    return EmbeddingProvider()
+
+
+# Status is polled every couple of seconds; the voice file is written during
+# upload before the row exists and never changes afterwards, so list once.
+@lru_cache(maxsize=256)
 def _voice_file_included(video_id: str) -> bool:
     path = video_dir(video_id)
     return any(file.suffix.lower() == ".txt" for file in path.glob("*.txt"))
 
 
+@lru_cache(maxsize=32)
+def _read_json_version(path: str, mtime_ns: int, size: int) -> Any:
+    # Reports and transcripts are re-fetched on every page view but only change
+    # when the task rewrites them (atomic replace), which changes mtime/size.
+    return read_json(Path(path))
+
+
+def _read_json_if_exists(path: Path) -> Optional[Any]:
+    """Parsed JSON at path, or None if it is missing. Shared and read-only."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return _read_json_version(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+# Search parses entities_json for every completed video on every query, so keep
+# the decoded dict per distinct payload. Keyed on the JSON text itself, so any
+# rewrite of the row misses; bounded so the cache doesn't track the whole
+# library. Callers must treat the result as read-only.
+@lru_cache(maxsize=256)
+def _parse_entities(entities_json: str) -> Tuple[dict, List[Tuple[str, str, dict]]]:
+    entities = parse_json(entities_json)
+    # (label, lowercased label, data), so search never re-lowercases labels.
+    rows = [(label, label.lower(), data) for label, data in entities.items()]
+    return entities, rows
+
+
+def _cached_entities(video: Video) -> Tuple[dict, List[Tuple[str, str, dict]]]:
+    if not video.entities_json:
+        return {}, []
+    return _parse_entities(video.entities_json)
+
+
+def _video_entities(video: Video) -> dict:
+    return _cached_entities(video)[0]
+
+
+@lru_cache(maxsize=32)
+def _read_frames_index(
+    path: str, mtime_ns: int, size: int
+) -> Tuple[List[dict], List[frozenset]]:
+    # Keyed on mtime/size so a re-run of the task (atomic replace) invalidates it.
+    frames = read_json(Path(path)).get("frames", [])
+    # Lowercased labels per frame, built once so entity filters are set lookups.
+    frame_labels = [
+        frozenset(str(det.get("label", "")).lower() for det in frame.get("detections", []))
+        for frame in frames
+    ]
+    return frames, frame_labels
+
+
+def _frames_index(video_id: str, entity: Optional[str] = None) -> List[dict]:
+    """Parsed frames.json for a video, optionally filtered by entity. Read-only."""
+    path = frames_index_path(video_id)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Frames not ready")
+    frames, frame_labels = _read_frames_index(str(path), stat.st_mtime_ns, stat.st_size)
+    if not entity:
+        return frames
+    target = entity.strip().lower()
+    return [frame for frame, labels in zip(frames, frame_labels) if target in labels]
+
+
+_STATUS_TEXT = {
+    "completed": "Processing complete",
+    "failed": "Processing failed",
+}
+
+_STAGE_TEXT = {
+    "extracting_frames": "Extracting video frames",
+    "transcribing_audio": "Transcribing audio",
+    "detecting_entities": "Analyzing video frames (no voice file)",
+    "aggregating_report": "Aggregating detections into report",
+    "indexing_search": "Indexing entities for search",
+}
+
+_DETECTING_WITH_VOICE_TEXT = "Analyzing video frames (voice file included)"
+
+
 def _status_text(stage: Optional[str], voice_included: bool, status: str) -> str:
-    if status == "completed":
-        return "Processing complete"
-    if status == "failed":
-        return "Processing failed"
-    voice_note = "voice file included" if voice_included else "no voice file"
-    if stage == "extracting_frames":
-        return "Extracting video frames"
-    if stage == "transcribing_audio":
-        return "Transcribing audio"
-    if stage == "detecting_entities":
-        return f"Analyzing video frames ({voice_note})"
-    if stage == "aggregating_report":
-        return "Aggregating detections into report"
-    if stage == "indexing_search":
-        return "Indexing entities for search"
-    return "Processing video"
+    if status in _STATUS_TEXT:
+        return _STATUS_TEXT[status]
+    if stage == "detecting_entities" and voice_included:
+        return _DETECTING_WITH_VOICE_TEXT
+    return _STAGE_TEXT.get(stage, "Processing video")
+
+
+async def _save_upload(upload: UploadFile, dest: Path) -> None:
+    # Stream to disk in 1 MiB chunks instead of buffering the whole upload in
+    # RAM. UploadFile.read runs in the threadpool, so large spooled uploads
+    # don't block the event loop (and status polls) while they copy.
+    with open(dest, "wb") as f:
+        while chunk := await upload.read(1024 * 1024):
+            f.write(chunk)
 
 
 @router.post("/videos", response_model=VideoCreateResponse)
@@ -120,13 +217,10 @@ async def upload_video(
     video_id = str(uuid.uuid4())
     dest_dir = video_dir(video_id)
     video_path = dest_dir / video_file.filename
-    with open(video_path, "wb") as f:
-        f.write(await video_file.read())
+    await _save_upload(video_file, video_path)
 
     if voice_file is not None:
-        voice_path = dest_dir / voice_file.filename
-        with open(voice_path, "wb") as f:
-            f.write(await voice_file.read())
+        await _save_upload(voice_file, dest_dir / voice_file.filename)
 
     video = Video(
         id=video_id,
@@ -195,8 +289,7 @@ async def upload_video_from_url_upload(
     cookie_path = None
     if cookies_file is not None:
         cookie_path = dest_dir / "cookies.txt"
-        with open(cookie_path, "wb") as f:
-            f.write(await cookies_file.read())
+        await _save_upload(cookies_file, cookie_path)
 
     try:
         video_path, filename = download_video_from_url(
@@ -241,8 +334,7 @@ async def check_video_url(
         temp_dir = Path("/tmp/entity_indexing_cookies")
         temp_dir.mkdir(parents=True, exist_ok=True)
         cookie_path = temp_dir / f"cookies_{uuid.uuid4().hex}.txt"
-        with open(cookie_path, "wb") as f:
-            f.write(await cookies_file.read())
+        await _save_upload(cookies_file, cookie_path)
     try:
         info = probe_video_url(url.strip(), cookie_file=cookie_path)
     except Exception as exc:
@@ -264,6 +356,7 @@ def list_videos(
     page_size: int = 20,
     session=Depends(get_session),
 ):
+    page_size = min(page_size, MAX_PAGE_SIZE)
     stmt = select(Video).order_by(Video.created_at.desc())
     count_stmt = select(func.count()).select_from(Video)
     if status:
@@ -294,7 +387,7 @@ def get_video(video_id: str, session=Depends(get_session)):
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
     report_ready = report_path(video_id).exists()
-    entities_data = json.loads(video.entities_json) if video.entities_json else {}
+    entities_data = _video_entities(video)
     entities = sorted(
         [
         VideoEntity(
@@ -304,7 +397,7 @@ def get_video(video_id: str, session=Depends(get_session)):
         )
         for label, data in entities_data.items()
     ],
-        key=lambda item: item.count,
+        key=attrgetter("count"),
         reverse=True,
     )
     return VideoDetail(
@@ -341,17 +434,17 @@ def get_report(video_id: str, session=Depends(get_session)):
     video = session.get(Video, video_id)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
-    path = report_path(video_id)
-    if not path.exists():
+    data = _read_json_if_exists(report_path(video_id))
+    if data is None:
         raise HTTPException(status_code=404, detail="Report not ready")
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = dict(data)  # the parsed report is cached; add fields to a copy
     if "video_id" not in data:
         data["video_id"] = video_id
     if "filename" not in data:
         data["filename"] = video.filename
-    t_path = transcript_path(video_id)
-    if t_path.exists():
-        data["transcript"] = json.loads(t_path.read_text(encoding="utf-8"))
+    transcript = _read_json_if_exists(transcript_path(video_id))
+    if transcript is not None:
+        data["transcript"] = transcript
     return data
 
 
@@ -383,15 +476,15 @@ def get_shared_report(token: str, session=Depends(get_session)):
     video = session.get(Video, link.video_id)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
-    path = report_path(video.id)
-    if not path.exists():
+    data = _read_json_if_exists(report_path(video.id))
+    if data is None:
         raise HTTPException(status_code=404, detail="Report not ready")
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = dict(data)  # the parsed report is cached; add fields to a copy
     data.setdefault("video_id", video.id)
     data.setdefault("filename", video.filename)
-    t_path = transcript_path(video.id)
-    if t_path.exists():
-        data["transcript"] = json.loads(t_path.read_text(encoding="utf-8"))
+    transcript = _read_json_if_exists(transcript_path(video.id))
+    if transcript is not None:
+        data["transcript"] = transcript
     return {
         "token": token,
         "video_id": video.id,
@@ -406,10 +499,10 @@ def get_transcript(video_id: str, session=Depends(get_session)):
     video = session.get(Video, video_id)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
-    path = transcript_path(video_id)
-    if not path.exists():
+    data = _read_json_if_exists(transcript_path(video_id))
+    if data is None:
         raise HTTPException(status_code=404, detail="Transcript not ready")
-    return json.loads(path.read_text(encoding="utf-8"))
+    return data
 
 
 @router.get("/videos/{video_id}/frames", response_model=FramesPage)
@@ -420,26 +513,15 @@ def get_frames(
     annotated: bool = False,
     entity: Optional[str] = None,
 ):
-    path = frames_index_path(video_id)
-    if not path.exists():
-        raise HTTPException(status_code=404, detail="Frames not ready")
-    data = json.loads(path.read_text(encoding="utf-8"))
-    frames = data.get("frames", [])
-    if entity:
-        target = entity.strip().lower()
-        frames = [
-            frame
-            for frame in frames
-            if any(
-                str(det.get("label", "")).lower() == target
-                for det in frame.get("detections", [])
-            )
-        ]
+    page_size = min(page_size, MAX_PAGE_SIZE)
+    frames = _frames_index(video_id, entity)
     total = len(frames)
     total_pages = math.ceil(total / page_size) if page_size else 0
     start = (page - 1) * page_size
     end = start + page_size
     sliced = frames[start:end]
+    # frames_dir() mkdirs on every call; resolve it once, not once per frame.
+    frames_root = frames_index_path(video_id).parent
     items = []
     for frame in sliced:
         frame_index = frame.get("frame_index", frame.get("index", 0))
@@ -447,7 +529,7 @@ def get_frames(
         if annotated:
             annotated_name = frame.get("annotated_filename")
             if annotated_name:
-                candidate = frames_index_path(video_id).parent / annotated_name
+                candidate = frames_root / annotated_name
                 if candidate.exists():
                     filename = annotated_name
         items.append(
@@ -468,10 +550,11 @@ def get_frames(
 
 @router.get("/videos/{video_id}/frames/{frame_name:path}")
 def serve_frame(video_id: str, frame_name: str):
-    path = frames_index_path(video_id).parent / frame_name
+    frames_root = frames_index_path(video_id).parent
+    path = frames_root / frame_name
     if not path.exists():
         if "annotated" in frame_name:
-            fallback = frames_index_path(video_id).parent / Path(frame_name).name
+            fallback = frames_root / Path(frame_name).name
             if fallback.exists():
                 return FileResponse(fallback)
         raise HTTPException(status_code=404, detail="Frame not found")
@@ -485,21 +568,8 @@ def get_nearest_frame(
     page_size: int = 12,
     entity: Optional[str] = None,
 ):
-    path = frames_index_path(video_id)
-    if not path.exists():
-        raise HTTPException(status_code=404, detail="Frames not ready")
-    data = json.loads(path.read_text(encoding="utf-8"))
-    frames = data.get("frames", [])
-    if entity:
-        target = entity.strip().lower()
-        frames = [
-            frame
-            for frame in frames
-            if any(
-                str(det.get("label", "")).lower() == target
-                for det in frame.get("detections", [])
-            )
-        ]
+    page_size = min(page_size, MAX_PAGE_SIZE)
+    frames = _frames_index(video_id, entity)
     if not frames:
         raise HTTPException(status_code=404, detail="No frames available for selection")
     closest_index = 0
@@ -541,7 +611,7 @@ def download_report(video_id: str, format: str = "json"):
     if format == "pdf":
         pdf_path = report_pdf_path(video_id)
         if not pdf_path.exists():
-            report = json.loads(json_path.read_text(encoding="utf-8"))
+            report = read_json(json_path)
             if not generate_pdf(report, pdf_path):
                 raise HTTPException(status_code=400, detail="PDF generation not available")
         return FileResponse(pdf_path, filename=f"{video_id}.pdf")
@@ -554,12 +624,21 @@ def download_report_csv(video_id: str, session=Depends(get_session)):
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
     json_path = report_path(video_id)
-    if not json_path.exists():
+    try:
+        json_mtime = json_path.stat().st_mtime
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Report not found")
     csv_path = report_csv_path(video_id)
-    report = json.loads(json_path.read_text(encoding="utf-8"))
-    if not generate_csv(report, csv_path):
-        raise HTTPException(status_code=400, detail="CSV generation failed")
+    try:
+        csv_mtime = csv_path.stat().st_mtime
+    except FileNotFoundError:
+        csv_mtime = None
+    # The worker writes report.csv right after report.json; only rebuild it
+    # when it is missing or older than the report.
+    if csv_mtime is None or csv_mtime < json_mtime:
+        report = read_json(json_path)
+        if not generate_csv(report, csv_path):
+            raise HTTPException(status_code=400, detail="CSV generation failed")
     return FileResponse(csv_path, filename=f"{video_id}.csv")
 
 
@@ -654,7 +733,7 @@ def search_entities(
             results=[],
         )
     tokens = parse_query(q)
-    provider = EmbeddingProvider()
+    provider = _embedding_provider()
     similar_labels = find_similar_entities(q, similarity, provider)
     exact_found = set()
     similar_label_set = {label.lower() for label, _ in similar_labels}
@@ -669,16 +748,25 @@ def search_entities(
     stmt = select(Video).where(Video.status == "completed")
     videos = session.execute(stmt).scalars().all()
 
+    # Videos share most of their label vocabulary, so match each distinct
+    # label once per query instead of once per video.
+    label_matches: Dict[str, Tuple[bool, bool]] = {}
+
     results = []
     for video in videos:
-        if not video.entities_json:
+        _, entity_rows = _cached_entities(video)
+        if not entity_rows:
             continue
-        entities = json.loads(video.entities_json)
         matched = []
-        for label, data in entities.items():
-            label_lower = label.lower()
-            exact_match = any(token_matches_label(token, label_lower) for token in tokens)
-            similar_match = label_lower in similar_label_set
+        for label, label_lower, data in entity_rows:
+            match = label_matches.get(label_lower)
+            if match is None:
+                match = (
+                    any(token_matches_label(token, label_lower) for token in tokens),
+                    label_lower in similar_label_set,
+                )
+                label_matches[label_lower] = match
+            exact_match, similar_match = match
             if exact_match or similar_match:
                 presence = data.get("presence", 0.0)
                 count = data.get("count", 0)
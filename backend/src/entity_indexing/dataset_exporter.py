@@ -12,7 +12,7 @@ from PIL import Image
 from backend.src.entity_indexing.config import DATA_DIR
 from backend.src.entity_indexing.db import SessionLocal
 from backend.src.entity_indexing.models import Video
-from backend.src.entity_indexing.storage import frames_dir, frames_index_path
+from backend.src.entity_indexing.storage import frames_dir, frames_index_path, read_json
 
 
 @dataclass
@@ -52,7 +52,7 @@ class FramesJsonAdapter(DetectionAdapter):
         path = frames_index_path(video_id)
         if not path.exists():
             return []
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = read_json(path)
         records: List[FrameRecord] = []
         for frame in data.get("frames", []):
             records.append(
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import numpy as np
 
 from .config import EMBEDDING_MODEL, INDEX_DIR
+from .storage import read_json
 
 
 class EmbeddingProvider:
@@ -55,12 +57,42 @@ def index_path() -> Path:
     return INDEX_DIR / "labels.json"
 
 
+@lru_cache(maxsize=4)
+def _read_label_index(path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, List[float]], ...]:
+    # Every search reloads the index; parse each on-disk version only once.
+    data = read_json(Path(path))
+    return tuple((item["label"], item["embedding"]) for item in data.get("labels", []))
+
+
 def load_label_index() -> Dict[str, List[float]]:
     path = index_path()
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         return {}
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return {item["label"]: item["embedding"] for item in data.get("labels", [])}
+    # Fresh dict per call: update_label_index adds to it before saving.
+    return dict(_read_label_index(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=4)
+def _label_matrix(
+    path: str, mtime_ns: int, size: int
+) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray]:
+    pairs = _read_label_index(path, mtime_ns, size)
+    if not pairs:
+        return (), np.empty((0, 0)), np.empty(0)
+    matrix = np.array([embedding for _, embedding in pairs], dtype=float)
+    return tuple(label for label, _ in pairs), matrix, np.linalg.norm(matrix, axis=1)
+
+
+def load_label_matrix() -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray]:
+    """Index labels, their embeddings stacked as rows, and the row norms. Read-only."""
+    path = index_path()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return (), np.empty((0, 0)), np.empty(0)
+    return _label_matrix(str(path), stat.st_mtime_ns, stat.st_size)
 
 
 def save_label_index(labels: Dict[str, List[float]]) -> None:
@@ -3,6 +3,10 @@ from __future__ import annotations
 import re
 
 
+MARKER_LABEL_RE = re.compile(r"^[A-Z0-9-]{3,}$")
+WHITESPACE_RE = re.compile(r"\\s+")
+
+
 CANONICAL_MAP = {
     "naval ship": "warship",
     "military ship": "warship",
@@ -38,9 +42,9 @@ def canonicalize_label(label: str) -> str:
     if not label:
         return label
     text = label.strip().lower()
-    if re.match(r"^[A-Z0-9-]{3,}$", label) and any(ch.isdigit() for ch in label):
+    if MARKER_LABEL_RE.match(label) and any(ch.isdigit() for ch in label):
         return label.strip().upper()
-    text = re.sub(r"\\s+", " ", text)
+    text = WHITESPACE_RE.sub(" ", text)
     if text in CANONICAL_MAP:
         return CANONICAL_MAP[text]
     if text in {"apc", "ifv"}:
@@ -8,15 +8,20 @@ from PIL import Image
 
 from .config import OCR_MIN_CONFIDENCE
 
+# Run for every OCR word of every frame; compiled once at import.
+OCR_TOKEN_CLEAN_RE = re.compile(r"[^A-Za-z0-9-]")
+HULL_NUMBER_RE = re.compile(r"[A-Z0-9]{2,}-\d{2,}")
+ALNUM_RUN_RE = re.compile(r"[A-Z0-9]{3,}")
+
 
 def _looks_like_marker(text: str) -> bool:
     if len(text) < 3:
         return False
     if text.isdigit():
         return False
-    if re.search(r"[A-Z0-9]{2,}-\d{2,}", text):
+    if HULL_NUMBER_RE.search(text):
         return True
-    if re.search(r"[A-Z0-9]{3,}", text) and any(ch.isdigit() for ch in text):
+    if ALNUM_RUN_RE.search(text) and any(ch.isdigit() for ch in text):
         return True
     if text.isupper() and len(text) >= 4:
         return True
@@ -43,7 +48,7 @@ def extract_ocr_entities(frame_path: Path, min_confidence: int = OCR_MIN_CONFIDE
             conf = -1
         if conf < min_confidence:
             continue
-        token = re.sub(r"[^A-Za-z0-9-]", "", text)
+        token = OCR_TOKEN_CLEAN_RE.sub("", text)
         if not token:
             continue
         token = token.upper()
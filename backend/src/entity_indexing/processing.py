@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import subprocess
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -182,6 +183,9 @@ def filter_frames_by_scene(
         return frame_files
     return kept
 
+# Every entity's ranges start/end on the same frame timestamps, so the labels
+# repeat heavily across a report; memoize them as a lookup table.
+@lru_cache(maxsize=4096)
 def _format_timestamp(seconds: float) -> str:
     total = int(round(seconds))
     minutes = total // 60
@@ -321,10 +325,10 @@ def aggregate_detections(
                 min_consecutive = MIN_CONSECUTIVE
             kept_set.update(_filter_consecutive(indices, min_consecutive))
 
-        kept_indices = sorted(kept_set)
-        if not kept_indices:
+        if not kept_set:
             continue
-        times = [frame_detections[i].timestamp_sec for i in kept_indices]
+        # merge_time_ranges sorts the timestamps itself, so don't sort indices first.
+        times = [frame_detections[i].timestamp_sec for i in kept_set]
         count = len(times)
         presence = count / total_frames if total_frames else 0.0
         time_ranges = merge_time_ranges(times, interval_sec)
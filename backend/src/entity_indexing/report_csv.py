@@ -43,69 +43,45 @@ def generate_csv(report: Dict, output_path: Path) -> bool:
                 ]
             )
             entities = report.get("entities", {}) or {}
+            interval = report.get("interval_sec", 0) or 0
             for label, data in entities.items():
-                count = data.get("count", 0)
                 presence = data.get("presence", 0.0)
-                appearances = data.get("appearances", 0)
-                confidence_score = data.get("confidence_score", "")
-                sources = ",".join(data.get("sources", []) or [])
-                raw_count = data.get("raw_count", "")
+                # Columns shared by every row of this entity, built once.
+                entity_cols = [
+                    meta["video_id"],
+                    meta["filename"],
+                    meta["duration_sec"],
+                    meta["interval_sec"],
+                    meta["frames_analyzed"],
+                    meta["unique_entities"],
+                    label,
+                    data.get("count", 0),
+                    presence,
+                    round(float(presence) * 100, 2) if presence != "" else "",
+                    data.get("appearances", 0),
+                    data.get("confidence_score", ""),
+                    ",".join(data.get("sources", []) or []),
+                    data.get("raw_count", ""),
+                ]
                 ranges = data.get("time_ranges", []) or []
                 if not ranges:
-                    writer.writerow(
-                        [
-                            meta["video_id"],
-                            meta["filename"],
-                            meta["duration_sec"],
-                            meta["interval_sec"],
-                            meta["frames_analyzed"],
-                            meta["unique_entities"],
-                            label,
-                            count,
-                            presence,
-                            round(float(presence) * 100, 2) if presence != "" else "",
-                            appearances,
-                            confidence_score,
-                            sources,
-                            raw_count,
-                            "",
-                            "",
-                            "",
-                            "",
-                            "",
-                            "",
-                        ]
-                    )
+                    writer.writerow(entity_cols + ["", "", "", "", "", ""])
                 else:
                     for idx, item in enumerate(ranges, 1):
                         start_sec = item.get("start_sec", "")
                         end_sec = item.get("end_sec", "")
-                        interval = report.get("interval_sec", 0) or 0
                         duration = ""
                         if start_sec != "" and end_sec != "":
                             duration = round(float(end_sec) - float(start_sec) + float(interval), 2)
                         writer.writerow(
-                            [
-                                meta["video_id"],
-                                meta["filename"],
-                                meta["duration_sec"],
-                                meta["interval_sec"],
-                                meta["frames_analyzed"],
-                            meta["unique_entities"],
-                            label,
-                            count,
-                            presence,
-                            round(float(presence) * 100, 2) if presence != "" else "",
-                            appearances,
-                            confidence_score,
-                            sources,
-                            raw_count,
-                            idx,
-                            start_sec,
-                            end_sec,
-                            item.get("start_label", ""),
-                            item.get("end_label", ""),
-                            duration,
+                            entity_cols
+                            + [
+                                idx,
+                                start_sec,
+                                end_sec,
+                                item.get("start_label", ""),
+                                item.get("end_label", ""),
+                                duration,
                             ]
                         )
         return True
@@ -1,46 +1,56 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, List, Tuple
 import re
 
-from .embeddings import EmbeddingProvider, cosine_similarity, load_label_index
+import numpy as np
+
+from .embeddings import EmbeddingProvider, load_label_matrix
 
 
 def parse_query(q: str) -> List[str]:
-    parts = [part.strip().lower() for part in q.split(",") if part.strip()]
-    tokens: List[str] = []
+    parts = [part for part in (raw.strip().lower() for raw in q.split(",")) if part]
+    # Insertion-ordered dict: O(1) dedup that keeps first-seen order.
+    tokens: Dict[str, None] = {}
 
+    # parts are already stripped and lowercased; words split from them are too.
     def add_token(token: str) -> None:
-        token = token.strip().lower()
         if not token:
             return
-        if token not in tokens:
-            tokens.append(token)
+        tokens.setdefault(token)
         # basic singularization for plural forms
         if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
-            singular = token[:-1]
-            if singular and singular not in tokens:
-                tokens.append(singular)
+            tokens.setdefault(token[:-1])
 
     for part in parts:
         add_token(part)
         for word in re.split(r"\s+", part):
             add_token(word)
 
-    return tokens
+    return list(tokens)
+
+
+@lru_cache(maxsize=256)
+def _query_vector(provider: EmbeddingProvider, query: str) -> np.ndarray:
+    # Repeated searches (paging, filter tweaks) re-send the same query text;
+    # skip the model forward pass for ones already embedded. Read-only.
+    return np.asarray(provider.encode([query])[0], dtype=float)
 
 
 def find_similar_entities(
     query: str, similarity: float, provider: EmbeddingProvider
 ) -> List[Tuple[str, float]]:
-    labels = load_label_index()
+    labels, matrix, norms = load_label_matrix()
     if not labels:
         return []
-    query_vec = provider.encode([query])[0]
-    scored = []
-    for label, vec in labels.items():
-        score = cosine_similarity(query_vec, vec)
-        if score >= similarity:
-            scored.append((label, score))
-    scored.sort(key=lambda item: item[1], reverse=True)
+    query_vec = _query_vector(provider, query)
+    # Cosine similarity against every label in one matrix-vector product,
+    # with cosine_similarity's 1.0 fallback for zero-norm vectors.
+    denom = norms * np.linalg.norm(query_vec)
+    denom[denom == 0] = 1.0
+    scores = matrix @ query_vec / denom
+    scored = [(labels[i], float(scores[i])) for i in np.flatnonzero(scores >= similarity)]
+    scored.sort(key=itemgetter(1), reverse=True)
     return scored
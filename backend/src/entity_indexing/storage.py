@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
+from typing import Any, Optional
 
 from .config import FRAMES_DIR, VIDEOS_DIR, REPORTS_DIR
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # optional speedup, stdlib json is the fallback
+    _loads = json.loads
+
 
 def video_dir(video_id: str) -> Path:
     path = VIDEOS_DIR / video_id
@@ -30,6 +40,7 @@ def report_path(video_id: str) -> Path:
 def report_pdf_path(video_id: str) -> Path:
     return reports_dir(video_id) / "report.pdf"
 
+
 def report_csv_path(video_id: str) -> Path:
     return reports_dir(video_id) / "report.csv"
 
@@ -40,3 +51,25 @@ def frames_index_path(video_id: str) -> Path:
 
 def transcript_path(video_id: str) -> Path:
     return reports_dir(video_id) / "transcript.json"
+
+
+def write_json_atomic(path: Path, payload: Any, indent: Optional[int] = 2) -> None:
+    """Write JSON next to ``path`` and swap it in, so readers never see a partial file."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    separators = (",", ":") if indent is None else None
+    tmp_path.write_text(json.dumps(payload, indent=indent, separators=separators), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def parse_json(raw: Any) -> Any:
+    """Parse JSON text or bytes, with orjson when it is installed."""
+    try:
+        return _loads(raw)
+    except ValueError:
+        # orjson rejects the NaN/Infinity literals json.dumps can emit.
+        return json.loads(raw)
+
+
+def read_json(path: Path) -> Any:
+    """Parse a JSON file, with orjson when it is installed."""
+    return parse_json(path.read_bytes())
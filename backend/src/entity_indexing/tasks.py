@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import traceback
+from collections import Counter
 from pathlib import Path
 from typing import List
 
@@ -50,6 +51,7 @@ from .storage import (
     frames_index_path,
     transcript_path,
     report_csv_path,
+    write_json_atomic,
 )
 from .report_csv import generate_csv
 from .transcription import transcribe_audio
@@ -61,9 +63,7 @@ from backend.src.utils.extract_audio import (
 from .normalize import canonicalize_label
 
 
-def update_video(
-    session, video_id: str, **fields
-):
+def update_video(session, video_id: str, **fields):
     video = session.get(Video, video_id)
     if not video:
         return
@@ -142,9 +142,7 @@ def process_video_task(video_id: str, video_path: str, interval_sec: int) -> Non
         if audio_analysis is not None:
             transcript_payload["audio_analysis"] = audio_analysis
 
-        transcript_path(video_id).write_text(
-            json.dumps(transcript_payload, indent=2), encoding="utf-8"
-        )
+        write_json_atomic(transcript_path(video_id), transcript_payload)
 
         update_video(
             session,
@@ -202,34 +200,35 @@ def process_video_task(video_id: str, video_path: str, interval_sec: int) -> Non
 
         # Verification pass (CLIP) to confirm discovery labels
         if VERIFY_ENABLED:
-            label_counts = {}
-            for frame in frame_detections:
-                for det in frame.detections:
-                    label = det.get("label")
-                    if not label:
-                        continue
-                    label_counts[label] = label_counts.get(label, 0) + 1
-            sorted_labels = sorted(label_counts.items(), key=lambda item: item[1], reverse=True)
-            candidate_labels = [label for label, _ in sorted_labels[:VERIFY_MAX_LABELS]]
-            verifier = ClipVerifier(candidate_labels)
-            verified_labels = set()
-            for idx, frame in enumerate(frame_detections):
-                if idx % max(1, VERIFY_EVERY_N) != 0:
-                    continue
-                verify_dets = verifier.verify(frames_path / frame.filename)
-                if verify_dets:
-                    for det in verify_dets:
-                        det["label"] = canonicalize_label(det.get("label", ""))
-                        verified_labels.add(det["label"])
-                    frame.detections.extend(verify_dets)
-            if verified_labels:
-                for frame in frame_detections:
-                    frame.detections = [
-                        det
-                        for det in frame.detections
-                        if det.get("source") != "discovery"
-                        or det.get("label") in verified_labels
-                    ]
+            label_counts = Counter(
+                det.get("label")
+                for frame in frame_detections
+                for det in frame.detections
+                if det.get("label")
+            )
+            # most_common(n) selects the top labels with a heap, not a full sort
+            candidate_labels = [label for label, _ in label_counts.most_common(VERIFY_MAX_LABELS)]
+            # Nothing was detected, so there is nothing to verify or filter.
+            if candidate_labels:
+                verifier = ClipVerifier(candidate_labels)
+                verified_labels = set()
+                for frame in frame_detections[:: max(1, VERIFY_EVERY_N)]:
+                    verify_dets = verifier.verify(frames_path / frame.filename)
+                    if verify_dets:
+                        for det in verify_dets:
+                            det["label"] = canonicalize_label(det.get("label", ""))
+                            verified_labels.add(det["label"])
+                        frame.detections.extend(verify_dets)
+                # Only caption discovery emits "discovery" detections; without it
+                # this filter would rebuild every frame's list unchanged.
+                if verified_labels and discovery is not None:
+                    for frame in frame_detections:
+                        frame.detections = [
+                            det
+                            for det in frame.detections
+                            if det.get("source") != "discovery"
+                            or det.get("label") in verified_labels
+                        ]
 
         report = aggregate_detections(
             frame_detections,
@@ -239,10 +238,12 @@ def process_video_task(video_id: str, video_path: str, interval_sec: int) -> Non
         report["video_id"] = video_id
         report["filename"] = Path(video_path).name
 
-        report_path(video_id).write_text(json.dumps(report, indent=2), encoding="utf-8")
-        frames_index_path(video_id).write_text(
-            json.dumps(build_frames_index(frame_detections), indent=2),
-            encoding="utf-8",
+        write_json_atomic(report_path(video_id), report)
+        # frames.json is only read back by the API, so keep it compact
+        write_json_atomic(
+            frames_index_path(video_id),
+            build_frames_index(frame_detections),
+            indent=None,
         )
         generate_csv(report, report_csv_path(video_id))
 
@@ -98,7 +98,7 @@ def download_video_from_url(
     if not candidates:
         raise RuntimeError("No file downloaded from URL.")
 
-    latest = max(candidates, key=lambda p: p.stat().st_mtime if p.exists() else time.time())
+    latest = max(candidates, key=_mtime_or_now)
     return latest, latest.name
 
 
@@ -169,6 +169,14 @@ def probe_video_url(
     }
 
 
+def _mtime_or_now(path: Path) -> float:
+    # One stat() per candidate; a file that vanished counts as newest.
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return time.time()
+
+
 def _looks_like_direct(url: str) -> bool:
     ext = Path(urlparse(url).path).suffix.lower()
     return ext in {".mp4", ".mov", ".mkv", ".avi", ".webm"}
@@ -9,6 +9,16 @@ def test_merge_time_ranges():
     ]
 
 
+def test_merge_time_ranges_unsorted():
+    # Callers pass detection timestamps in dict order, not sorted.
+    ranges = merge_time_ranges([25, 10, 0, 30, 5, 5], interval_sec=5)
+    assert ranges == merge_time_ranges([0, 5, 10, 25, 30], interval_sec=5)
+    assert merge_time_ranges([40], interval_sec=5) == [
+        {"start_sec": 40.0, "end_sec": 40.0, "start_label": "00:40", "end_label": "00:40"},
+    ]
+    assert merge_time_ranges([], interval_sec=5) == []
+
+
 def test_aggregate_detections():
     frames = [
         FrameDetection(index=0, timestamp_sec=0, filename="f0.jpg", detections=[{"label": "aircraft", "confidence": 0.9}]),
@@ -0,0 +1,42 @@
+from thales.fusion import find_speech_for_time, fuse_speech_and_vision, write_jsonl
+
+
+def _speech(t_start, t_end, text):
+    return {"t_start": t_start, "t_end": t_end, "t": (t_start + t_end) / 2, "text": text}
+
+
+def test_fuse_speech_and_vision_context(tmp_path):
+    speech = [
+        _speech(12.0, 20.0, "after gap"),
+        _speech(0.0, 10.0, "long"),
+        _speech(5.0, 8.0, "nested"),
+        _speech(18.0, 24.0, "overlap"),
+    ]
+    times = [0.0, 7.0, 9.0, 11.0, 12.0, 19.0, 22.0, 30.0]
+    vision = [{"t": t, "event": "appear", "targets": ["tank"]} for t in times]
+    write_jsonl(speech, tmp_path / "speech.jsonl")
+    write_jsonl(vision, tmp_path / "vision.jsonl")
+
+    merged = fuse_speech_and_vision(
+        tmp_path / "speech.jsonl", tmp_path / "vision.jsonl", tmp_path / "merged.jsonl"
+    )
+
+    contexts = {
+        e["t"]: (e["speech_context"] or {}).get("text") for e in merged if e["source"] == "vision"
+    }
+    # First unit (by start) covering t wins; gaps and the tail have no context.
+    assert contexts == {
+        0.0: "long",
+        7.0: "long",
+        9.0: "long",
+        11.0: None,
+        12.0: "after gap",
+        19.0: "after gap",
+        22.0: "overlap",
+        30.0: None,
+    }
+
+    ordered = sorted(speech, key=lambda s: s["t_start"])
+    for t, text in contexts.items():
+        expected = find_speech_for_time(ordered, t)
+        assert text == (expected["text"] if expected else None)
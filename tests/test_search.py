@@ -1,5 +1,26 @@
+import numpy as np
+
+from backend.src.entity_indexing import search
 from backend.src.entity_indexing.embeddings import cosine_similarity
-from backend.src.entity_indexing.search import parse_query
+from backend.src.entity_indexing.search import find_similar_entities, parse_query
+
+
+class _FakeProvider:
+    def __init__(self, vectors):
+        self.vectors = vectors
+
+    def encode(self, texts):
+        return [self.vectors[text] for text in texts]
+
+
+def _use_label_matrix(monkeypatch, labels, matrix):
+    matrix = np.array(matrix, dtype=float)
+    monkeypatch.setattr(
+        search,
+        "load_label_matrix",
+        lambda: (tuple(labels), matrix, np.linalg.norm(matrix, axis=1)),
+    )
+    return matrix
 
 
 def test_parse_query():
@@ -10,3 +31,31 @@ def test_parse_query():
 def test_cosine_similarity():
     assert round(cosine_similarity([1, 0], [1, 0]), 5) == 1.0
     assert round(cosine_similarity([1, 0], [0, 1]), 5) == 0.0
+
+
+def test_find_similar_entities_matches_cosine_similarity(monkeypatch):
+    labels = ["drone", "truck", "tank", "blank"]
+    matrix = _use_label_matrix(
+        monkeypatch, labels, [[0.0, 1.0], [0.6, 0.8], [1.0, 0.0], [0.0, 0.0]]
+    )
+    query = [2.0, 0.5]
+    provider = _FakeProvider({"tank": query})
+
+    results = find_similar_entities("tank", 0.0, provider)
+
+    # Highest score first; the zero-norm label scores 0.0 instead of NaN.
+    assert [label for label, _ in results] == ["tank", "truck", "drone", "blank"]
+    for label, score in results:
+        expected = cosine_similarity(matrix[labels.index(label)].tolist(), query)
+        assert round(score, 6) == round(expected, 6)
+
+    above = find_similar_entities("tank", 0.7, provider)
+    assert [label for label, _ in above] == ["tank", "truck"]
+
+
+def test_find_similar_entities_zero_query(monkeypatch):
+    _use_label_matrix(monkeypatch, ["tank", "drone"], [[1.0, 0.0], [0.0, 1.0]])
+    provider = _FakeProvider({"static": [0.0, 0.0]})
+
+    assert find_similar_entities("static", 0.0, provider) == [("tank", 0.0), ("drone", 0.0)]
+    assert find_similar_entities("static", 0.1, provider) == []
@@ -5,14 +5,13 @@ Vision-first discovery mode for proposing entities from sampled frames.
 from __future__ import annotations
 
 import base64
-import io
 import json
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import cv2
 import numpy as np
-from PIL import Image
 from mistralai import Mistral
 
 from thales.config import MISTRAL_API_KEY, MAX_IMAGE_SIZE, PIXTRAL_MODEL
@@ -27,9 +26,10 @@ DISCOVERY_PROMPT = (
 )
 
 
+@lru_cache(maxsize=1)
 def get_pixtral_client() -> Mistral:
     """
-    Get an initialized Mistral client for Pixtral vision model.
+    Get an initialized Mistral client for Pixtral vision model (cached per process).
     """
     if not MISTRAL_API_KEY:
         raise ValueError(
@@ -43,17 +43,17 @@ def frame_to_base64(frame: np.ndarray) -> str:
     """
     Convert OpenCV frame (BGR) to base64-encoded JPEG string.
     """
-    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    pil_image = Image.fromarray(rgb_frame)
+    height, width = frame.shape[:2]
+    if width > MAX_IMAGE_SIZE or height > MAX_IMAGE_SIZE:
+        scale = MAX_IMAGE_SIZE / max(width, height)
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
 
-    if pil_image.width > MAX_IMAGE_SIZE or pil_image.height > MAX_IMAGE_SIZE:
-        pil_image.thumbnail((MAX_IMAGE_SIZE, MAX_IMAGE_SIZE), Image.Resampling.LANCZOS)
+    ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+    if not ok:
+        raise ValueError("Could not encode frame as JPEG")
 
-    buffer = io.BytesIO()
-    pil_image.save(buffer, format="JPEG", quality=85)
-    buffer.seek(0)
-
-    return base64.standard_b64encode(buffer.read()).decode("utf-8")
+    return base64.b64encode(encoded).decode("ascii")
 
 
 def _parse_entity_list(content: str) -> List[str]:
@@ -2,13 +2,16 @@
 Entity categorization using ML-based zero-shot classification.
 """
 
-import torch
-from transformers import pipeline
+import heapq
 from typing import Dict, List
 
 from thales.config import ENTITY_CATEGORIES, ENTITY_TO_VISUAL_CATEGORY
 
 
+# Lowercased category names, built once instead of per categorized entity.
+_CATEGORIES_LOWER = frozenset(c.lower() for c in ENTITY_CATEGORIES)
+
+
 def initialize_categorizer():
     """
     Initialize a zero-shot classification pipeline for entity categorization.
@@ -18,6 +21,11 @@ def initialize_categorizer():
     """
     print("Initializing entity categorizer model...")
     
+    # Deferred so runs that never categorize (e.g. no voice entities) skip
+    # the torch/transformers import cost.
+    import torch
+    from transformers import pipeline
+    
     # Determine device
     if torch.cuda.is_available():
         device = 0
@@ -58,12 +66,12 @@ def categorize_entity_with_context(
         return ENTITY_TO_VISUAL_CATEGORY[entity_lower]
     
     # Check if it's already a visual category
-    if entity_lower in [c.lower() for c in ENTITY_CATEGORIES]:
+    if entity_lower in _CATEGORIES_LOWER:
         return entity_lower
     
     # Combine context for ML classification
     if context and len(context) > 0:
-        context_snippets = sorted(context, key=len, reverse=True)[:3]
+        context_snippets = heapq.nlargest(3, context, key=len)
         full_context = " ".join(context_snippets)
         classification_text = (
             f"In the following context: '{full_context[:400]}', "
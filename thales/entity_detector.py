@@ -3,8 +3,7 @@ Entity detection in video frames using Pixtral vision model.
 """
 
 import base64
-import io
-from PIL import Image
+from functools import lru_cache
 import numpy as np
 import cv2
 from typing import List, Dict, Any, Optional, Tuple
@@ -24,10 +23,14 @@ from thales.entity_categorizer import categorize_entities, initialize_categorize
 from thales.discovery import discover_entities_in_video
 
 
+@lru_cache(maxsize=1)
 def get_pixtral_client() -> Mistral:
     """
     Get an initialized Mistral client for Pixtral vision model.
     
+    The client is created once per process and reused, so repeated pipeline
+    and scene-analysis calls share one HTTP session.
+    
     Returns:
         Initialized Mistral client
         
@@ -52,17 +55,19 @@ def frame_to_base64(frame: np.ndarray) -> str:
     Returns:
         Base64-encoded JPEG image string
     """
-    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    pil_image = Image.fromarray(rgb_frame)
-    
-    if pil_image.width > MAX_IMAGE_SIZE or pil_image.height > MAX_IMAGE_SIZE:
-        pil_image.thumbnail((MAX_IMAGE_SIZE, MAX_IMAGE_SIZE), Image.Resampling.LANCZOS)
+    # Resize and encode straight from BGR with OpenCV: no RGB copy, no PIL
+    # round-trip, and both calls release the GIL so worker threads overlap.
+    height, width = frame.shape[:2]
+    if width > MAX_IMAGE_SIZE or height > MAX_IMAGE_SIZE:
+        scale = MAX_IMAGE_SIZE / max(width, height)
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
     
-    buffer = io.BytesIO()
-    pil_image.save(buffer, format="JPEG", quality=85)
-    buffer.seek(0)
+    ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+    if not ok:
+        raise ValueError("Could not encode frame as JPEG")
     
-    return base64.standard_b64encode(buffer.read()).decode("utf-8")
+    return base64.b64encode(encoded).decode("ascii")
 
 
 def detect_entities_in_frame_batch(
@@ -140,17 +145,18 @@ List ALL entities with their detection status:"""
         content = response.choices[0].message.content.strip()
         results = {entity: False for entity in entities}
         
+        # Lowercase the requested names once; first spelling wins on collisions
+        entity_by_lower: Dict[str, str] = {}
+        for entity in entities:
+            entity_by_lower.setdefault(entity.lower(), entity)
+        
         for line in content.split('\n'):
             line = line.strip()
             if ':' in line:
                 parts = line.split(':', 1)
-                entity_name = parts[0].strip()
-                detection = parts[1].strip().upper()
-                
-                for entity in entities:
-                    if entity.lower() == entity_name.lower():
-                        results[entity] = detection == "YES"
-                        break
+                entity = entity_by_lower.get(parts[0].strip().lower())
+                if entity is not None:
+                    results[entity] = parts[1].strip().upper() == "YES"
         
         return results
         
@@ -223,7 +229,9 @@ def process_video_with_voice(
     per-entity metadata (source/discovered_only).
     """
     print(f"Extracting entities from {voice_file_path}...")
-    speech_entities = get_entity_list(voice_file_path)
+    # Shared by the entity and context passes below, scoped to this run.
+    segment_cache: Dict[str, Tuple[str, ...]] = {}
+    speech_entities = get_entity_list(voice_file_path, segment_cache)
     speech_set = set(speech_entities)
 
     discovery_entities = set()
@@ -277,7 +285,9 @@ def process_video_with_voice(
 
     print("\nExtracting context for entities...")
     entity_contexts = (
-        extract_entities_with_context(voice_file_path) if speech_entities else {}
+        extract_entities_with_context(voice_file_path, segment_cache)
+        if speech_entities
+        else {}
     )
 
     print("\nCategorizing entities using ML with context...")
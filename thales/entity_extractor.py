@@ -4,7 +4,8 @@ Entity extraction from voice transcripts using Mistral LLM.
 
 import re
 import json
-from typing import List, Set, Dict, Optional
+from functools import lru_cache
+from typing import List, Set, Dict, Optional, Tuple
 from mistralai import Mistral
 
 from thales.config import (
@@ -17,10 +18,14 @@ from thales.config import (
 from thales.voice_parser import get_all_segments
 
 
+@lru_cache(maxsize=1)
 def get_mistral_client() -> Mistral:
     """
     Get an initialized Mistral API client.
     
+    The client is created once per process and reused across segments and
+    extraction passes.
+    
     Returns:
         Initialized Mistral client
         
@@ -91,6 +96,17 @@ def extract_entities_from_text(text: str, client: Mistral) -> List[str]:
     Returns:
         List of entity names found in the text
     """
+    entities = _request_entities(text, client)
+    return entities if entities is not None else []
+
+
+def _request_entities(text: str, client: Mistral) -> Optional[List[str]]:
+    """
+    Body of extract_entities_from_text.
+    
+    Returns None instead of [] when the API call fails or the reply cannot
+    be parsed, so callers can tell a failure from "no entities".
+    """
     if not text or len(text.strip()) == 0:
         return []
     
@@ -167,19 +183,46 @@ If no entities found, return: {{"entities": []}}
                     return entities
         
         print(f"Warning: Could not parse entity extraction response: {content[:200]}")
-        return []
+        return None
         
     except Exception as e:
         print(f"Error extracting entities with Mistral: {e}")
-        return []
+        return None
+
+
+def _segment_entities(
+    text: str,
+    client: Mistral,
+    cache: Optional[Dict[str, Tuple[str, ...]]] = None,
+) -> Tuple[str, ...]:
+    """
+    extract_entities_from_text for one transcript segment, memoized in cache.
+    
+    The entity pass and the context pass run over the same segments, so the
+    second pass reuses the first pass's LLM answers instead of re-querying.
+    Failed or unparseable calls are not stored and get retried.
+    """
+    if cache is not None and text in cache:
+        return cache[text]
+    entities = _request_entities(text, client)
+    if entities is None:
+        return ()
+    result = tuple(entities)
+    if cache is not None:
+        cache[text] = result
+    return result
 
 
-def extract_military_entities(voice_file_path: str) -> Set[str]:
+def extract_military_entities(
+    voice_file_path: str,
+    segment_cache: Optional[Dict[str, Tuple[str, ...]]] = None,
+) -> Set[str]:
     """
     Extract all military-relevant entities from a voice file.
     
     Args:
         voice_file_path: Path to the voice file
+        segment_cache: Optional per-run memo of segment text -> entities
         
     Returns:
         Set of unique normalized entity names
@@ -197,7 +240,7 @@ def extract_military_entities(voice_file_path: str) -> Set[str]:
         if i % 10 == 0:
             print(f"  Processing segment {i+1}/{len(segments)}")
         
-        entities = extract_entities_from_text(text, client)
+        entities = _segment_entities(text, client, segment_cache)
         
         for entity in entities:
             normalized = normalize_entity(entity)
@@ -208,26 +251,34 @@ def extract_military_entities(voice_file_path: str) -> Set[str]:
     return all_entities
 
 
-def get_entity_list(voice_file_path: str) -> List[str]:
+def get_entity_list(
+    voice_file_path: str,
+    segment_cache: Optional[Dict[str, Tuple[str, ...]]] = None,
+) -> List[str]:
     """
     Get a sorted list of unique military entities from a voice file.
     
     Args:
         voice_file_path: Path to the voice file
+        segment_cache: Optional per-run memo of segment text -> entities
         
     Returns:
         Sorted list of entity names
     """
-    entities = extract_military_entities(voice_file_path)
+    entities = extract_military_entities(voice_file_path, segment_cache)
     return sorted(list(entities))
 
 
-def extract_entities_with_context(voice_file_path: str) -> Dict[str, List[str]]:
+def extract_entities_with_context(
+    voice_file_path: str,
+    segment_cache: Optional[Dict[str, Tuple[str, ...]]] = None,
+) -> Dict[str, List[str]]:
     """
     Extract entities with their surrounding context from a voice file.
     
     Args:
         voice_file_path: Path to the voice file
+        segment_cache: Optional per-run memo of segment text -> entities
         
     Returns:
         Dictionary mapping entity names to lists of context strings
@@ -245,8 +296,9 @@ def extract_entities_with_context(voice_file_path: str) -> Dict[str, List[str]]:
         if i % 10 == 0:
             print(f"  Processing segment {i+1}/{len(segments)}")
         
-        entities = extract_entities_from_text(text, client)
+        entities = _segment_entities(text, client, segment_cache)
         
+        text_lower = text.lower()
         for entity_text in entities:
             normalized = normalize_entity(entity_text)
             if not normalized:
@@ -254,7 +306,6 @@ def extract_entities_with_context(voice_file_path: str) -> Dict[str, List[str]]:
             
             try:
                 entity_lower = entity_text.strip().lower()
-                text_lower = text.lower()
                 
                 start_pos = 0
                 while True:
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import csv
 import json
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
+from thales.jsonio import parse_json
+
 
 # =========================
 # Helpers
@@ -41,15 +44,13 @@ def hhmmss(seconds: Optional[float]) -> str:
 
 def iter_jsonl(path: Path) -> List[Dict[str, Any]]:
     out: List[Dict[str, Any]] = []
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                out.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
+    for line in path.read_bytes().splitlines():
+        if not line.strip():
+            continue
+        try:
+            out.append(parse_json(line))
+        except json.JSONDecodeError:
+            continue
     return out
 
 
@@ -124,8 +125,13 @@ def export_thales_csv(
         video_stem = merged_path.name.replace("_merged.jsonl", "")  # e.g. video_1
         events = iter_jsonl(merged_path)
 
-        # Collect all timestamps from merged file to determine start/stop
-        times = [safe_float(e.get("t")) for e in events if safe_float(e.get("t")) is not None]
+        # Parse each event time once; reused for start/stop and observation order
+        timed = []
+        for e in events:
+            t = safe_float(e.get("t"))
+            if t is not None:
+                timed.append((t, e))
+        times = [t for t, _ in timed]
         t_min = min(times) if times else 0.0
 
         # Try to get real duration from video file; otherwise use max event time
@@ -151,14 +157,12 @@ def export_thales_csv(
         })
 
         # --- Observation rows (vision appear/disappear)
-        for e in sorted(events, key=lambda x: safe_float(x.get("t")) or 0.0):
+        # merged pivots are written time-ordered, so this sort is a single run check
+        timed.sort(key=itemgetter(0))
+        for t, e in timed:
             if e.get("source") != "vision":
                 continue
 
-            t = safe_float(e.get("t"))
-            if t is None:
-                continue
-
             ev = str(e.get("event", "")).strip().lower()
             if ev not in {"appear", "disappear"}:
                 continue
@@ -178,6 +182,9 @@ def export_thales_csv(
                 sc_ts = "" if _ts is None else round(_ts, 3)
                 sc_te = "" if _te is None else round(_te, 3)
 
+            # Format the time once per event; it is shared by every target row.
+            timecode = mmss(t)
+            t_sec = round(float(t), 3)
             for entity in targets:
                 entity = str(entity).strip()
                 if not entity:
@@ -191,8 +198,8 @@ def export_thales_csv(
                     "Video": video_stem,
                     "Entity": entity,
                     "Event": ev,
-                    "Timecode (MM:SS)": mmss(t),
-                    "Time (sec)": round(float(t), 3),
+                    "Timecode (MM:SS)": timecode,
+                    "Time (sec)": t_sec,
                     "Speech context": sc_text,
                     "Speech seg start (sec)": sc_ts,
                     "Speech seg end (sec)": sc_te,
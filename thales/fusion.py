@@ -1,20 +1,23 @@
 from __future__ import annotations
 
 import json
+from bisect import bisect_left
+from itertools import accumulate
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+from thales.jsonio import parse_json
+
 
 def read_jsonl(path: Path) -> List[Dict[str, Any]]:
     rows: List[Dict[str, Any]] = []
     if not path.exists():
         return rows
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            rows.append(json.loads(line))
+    # One read + C-level splitlines instead of a buffered text readline loop.
+    append = rows.append
+    for line in path.read_bytes().splitlines():
+        if line.strip():
+            append(parse_json(line))
     return rows
 
 
@@ -63,10 +66,15 @@ def fuse_speech_and_vision(
             "avg_logprob": s.get("avg_logprob", None),
         })
 
-    # 2) enrich each vision event with the speech context at same time
+    # 2) enrich each vision event with the speech context at same time.
+    # Same answer as find_speech_for_time, by bisection: the first unit with
+    # t_end >= t is the first index whose running max of t_end reaches t.
+    starts = [float(s["t_start"]) for s in speech]
+    reach = list(accumulate((float(s["t_end"]) for s in speech), max))
     for v in vision:
         t = float(v["t"])
-        s = find_speech_for_time(speech, t)
+        i = bisect_left(reach, t)
+        s = speech[i] if i < len(speech) and starts[i] <= t else None
 
         merged.append({
             "t": t,
@@ -0,0 +1,26 @@
+"""
+JSON parsing helper shared by the thales JSONL readers.
+
+Uses orjson when it is installed and falls back to the stdlib otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # optional speedup, stdlib json is the fallback
+    _loads = json.loads
+
+
+def parse_json(raw: Any) -> Any:
+    """Parse JSON text or bytes, with orjson when it is installed."""
+    try:
+        return _loads(raw)
+    except ValueError:
+        # orjson rejects the NaN/Infinity literals json.dumps can emit.
+        return json.loads(raw)
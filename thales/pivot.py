@@ -78,16 +78,23 @@ def iter_speech_units(segments_df: pd.DataFrame) -> Iterator[Dict[str, Any]]:
     - if a segment contains multiple sentences, split and allocate times
     - adds a punctual timestamp t = midpoint of (t_start, t_end)
     """
-    for _, row in segments_df.iterrows():
-        t_start = float(row["start"])
-        t_end = float(row["end"])
-        text = str(row["text"] if "text" in row else "").strip()
+    # Pull plain column lists once; iterrows() boxes every row into a Series.
+    n = len(segments_df)
+    columns = segments_df.columns
+    starts = segments_df["start"].tolist() if n else []
+    ends = segments_df["end"].tolist() if n else []
+    texts = segments_df["text"].tolist() if "text" in columns else [""] * n
+    logprobs = segments_df["avg_logprob"].tolist() if "avg_logprob" in columns else [None] * n
+
+    for t_start, t_end, text, val in zip(starts, ends, texts, logprobs):
+        t_start = float(t_start)
+        t_end = float(t_end)
+        text = str(text).strip()
         if not text:
             continue
 
         avg_logprob = None
         try:
-            val = row.get("avg_logprob", None)
             if val is not None and not pd.isna(val):
                 avg_logprob = float(val)
         except Exception:
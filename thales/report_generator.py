@@ -22,6 +22,16 @@ def seconds_to_timestamp(seconds: int) -> str:
     return f"{minutes:02d}:{secs:02d}"
 
 
+def _time_range(start_second: int, end_second: int) -> Dict[str, Any]:
+    return {
+        "start": seconds_to_timestamp(start_second),
+        "end": seconds_to_timestamp(end_second),
+        "start_second": start_second,
+        "end_second": end_second,
+        "duration_seconds": end_second - start_second + 1
+    }
+
+
 def generate_report(
     video_path: str,
     detection_results: Dict[str, List[Dict[str, Any]]],
@@ -49,43 +59,27 @@ def generate_report(
     }
     
     for entity, detections in detection_results.items():
-        present_detections = [d for d in detections if d['present']]
-        
         total_frames = len(detections)
-        present_frames = len(present_detections)
-        presence_percentage = (present_frames / total_frames * 100) if total_frames > 0 else 0
+        present_frames = 0
         
-        # Calculate time ranges where entity is present
+        # Count present frames and build the time ranges in a single pass
         time_ranges = []
-        if present_detections:
-            current_range_start = None
-            current_range_end = None
-            
-            for det in detections:
-                if det['present']:
-                    if current_range_start is None:
-                        current_range_start = det['second']
-                    current_range_end = det['second']
-                else:
-                    if current_range_start is not None:
-                        time_ranges.append({
-                            "start": seconds_to_timestamp(current_range_start),
-                            "end": seconds_to_timestamp(current_range_end),
-                            "start_second": current_range_start,
-                            "end_second": current_range_end,
-                            "duration_seconds": current_range_end - current_range_start + 1
-                        })
-                        current_range_start = None
-                        current_range_end = None
-            
-            if current_range_start is not None:
-                time_ranges.append({
-                    "start": seconds_to_timestamp(current_range_start),
-                    "end": seconds_to_timestamp(current_range_end),
-                    "start_second": current_range_start,
-                    "end_second": current_range_end,
-                    "duration_seconds": current_range_end - current_range_start + 1
-                })
+        current_range_start = None
+        current_range_end = None
+        for det in detections:
+            if det['present']:
+                present_frames += 1
+                if current_range_start is None:
+                    current_range_start = det['second']
+                current_range_end = det['second']
+            elif current_range_start is not None:
+                time_ranges.append(_time_range(current_range_start, current_range_end))
+                current_range_start = None
+        
+        if current_range_start is not None:
+            time_ranges.append(_time_range(current_range_start, current_range_end))
+        
+        presence_percentage = (present_frames / total_frames * 100) if total_frames > 0 else 0
         
         entity_payload: Dict[str, Any] = {
             "statistics": {
@@ -4,6 +4,7 @@ Scene-level analysis for describing what is happening in the video over time.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Callable, Dict, List, Optional
 
 from thales.entity_detector import frame_to_base64, get_pixtral_client
@@ -41,6 +42,7 @@ def generate_scene_timeline(
     interval_seconds: int = 10,
     max_frames: int = 120,
     progress_cb: Optional[Callable[[int, int, Dict[str, Any]], None]] = None,
+    max_workers: int = 4,
 ) -> List[Dict[str, Any]]:
     client = get_pixtral_client()
 
@@ -52,19 +54,35 @@ def generate_scene_timeline(
         step = max(1, int(len(frames) / max_frames) + 1)
         frames = frames[::step]
 
-    timeline: List[Dict[str, Any]] = []
     total = len(frames)
 
-    for idx, (second, frame) in enumerate(frames, 1):
-        image_base64 = frame_to_base64(frame)
-        summary = describe_frame(client, image_base64)
-        entry = {
+    def analyze(second: int, frame) -> Dict[str, Any]:
+        summary = describe_frame(client, frame_to_base64(frame))
+        return {
             "timestamp": seconds_to_timestamp(int(second)),
             "second": int(second),
             "summary": summary,
         }
-        timeline.append(entry)
-        if progress_cb:
-            progress_cb(idx, total, entry)
 
-    return timeline
+    # Each frame is one blocking Pixtral round-trip, so overlap them in threads.
+    # progress_cb runs on the calling thread, in completion order.
+    entries: Dict[int, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            executor.submit(analyze, second, frame): pos
+            for pos, (second, frame) in enumerate(frames)
+        }
+        try:
+            for done, future in enumerate(as_completed(futures), 1):
+                entry = future.result()
+                entries[futures[future]] = entry
+                if progress_cb:
+                    progress_cb(done, total, entry)
+        except BaseException:
+            # Fail fast: drop the queued (billed) calls instead of letting the
+            # executor's exit wait for all of them before the error surfaces.
+            for pending in futures:
+                pending.cancel()
+            raise
+
+    return [entries[pos] for pos in range(total)]
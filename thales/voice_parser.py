@@ -2,11 +2,18 @@
 Voice file parser for extracting timestamped segments from transcripts.
 """
 
+import os
 import re
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, List, Tuple
 from pathlib import Path
 
 
+# Matches timestamps like "Speaker 1  (00:01)" or "(01:23)"
+TIMESTAMP_RE = re.compile(r'\((\d{2}):(\d{2})\)')
+
+
 def parse_voice_file(voice_file_path: str) -> Dict[str, str]:
     """
     Parse a voice file to extract timestamped segments.
@@ -17,42 +24,38 @@ def parse_voice_file(voice_file_path: str) -> Dict[str, str]:
     Returns:
         Dictionary mapping timestamps (MM:SS format) to text descriptions
     """
-    with open(voice_file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Pattern to match timestamps like "Speaker 1  (00:01)" or "(01:23)"
-    timestamp_pattern = r'\((\d{2}):(\d{2})\)'
-    
     segments = {}
-    lines = content.split('\n')
     current_timestamp = None
     current_text = []
     
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        # Check if line contains a timestamp
-        match = re.search(timestamp_pattern, line)
-        if match:
-            # Save previous segment if exists
-            if current_timestamp is not None and current_text:
-                segments[current_timestamp] = ' '.join(current_text)
-            
-            # Extract timestamp
-            minutes, seconds = match.groups()
-            current_timestamp = f"{minutes}:{seconds}"
-            current_text = []
-            
-            # Extract text after timestamp on the same line
-            text_after_timestamp = line[match.end():].strip()
-            if text_after_timestamp:
-                current_text.append(text_after_timestamp)
-        else:
-            # Continue accumulating text for current segment
-            if current_timestamp is not None:
-                current_text.append(line)
+    # Stream the file line by line rather than holding the whole transcript
+    # and a list of its lines in memory at once.
+    with open(voice_file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+                
+            # Check if line contains a timestamp
+            match = TIMESTAMP_RE.search(line)
+            if match:
+                # Save previous segment if exists
+                if current_timestamp is not None and current_text:
+                    segments[current_timestamp] = ' '.join(current_text)
+                
+                # Extract timestamp
+                minutes, seconds = match.groups()
+                current_timestamp = f"{minutes}:{seconds}"
+                current_text = []
+                
+                # Extract text after timestamp on the same line
+                text_after_timestamp = line[match.end():].strip()
+                if text_after_timestamp:
+                    current_text.append(text_after_timestamp)
+            else:
+                # Continue accumulating text for current segment
+                if current_timestamp is not None:
+                    current_text.append(line)
     
     # Don't forget the last segment
     if current_timestamp is not None and current_text:
@@ -71,6 +74,14 @@ def get_all_segments(voice_file_path: str) -> List[Tuple[str, str]]:
     Returns:
         List of (timestamp, text) tuples, sorted by timestamp
     """
+    stat = os.stat(voice_file_path)
+    return list(_sorted_segments(str(voice_file_path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=16)
+def _sorted_segments(voice_file_path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, str], ...]:
+    # The entity and context passes both ask for the same file; parse it once
+    # per on-disk version (mtime/size in the key).
     segments = parse_voice_file(voice_file_path)
     
     # Convert to list and sort by timestamp
@@ -81,7 +92,6 @@ def get_all_segments(voice_file_path: str) -> List[Tuple[str, str]]:
         result.append((timestamp, text, total_seconds))
     
     # Sort by total seconds
-    result.sort(key=lambda x: x[2])
+    result.sort(key=itemgetter(2))
     
-    return [(ts, text) for ts, text, _ in result]
-
+    return tuple((ts, text) for ts, text, _ in result)
@@ -1,6 +1,6 @@
 import os
 import time
-from typing import Optional
+from typing import List, Optional
 
 import requests
 import streamlit as st
@@ -33,6 +33,23 @@ def api_get(path: str):
     return res.json()
 
 
+def count_videos(status: Optional[str] = None) -> int:
+    # The listing is paged; its total is the count across all pages.
+    query = f"?status={status}&page_size=1" if status else "?page_size=1"
+    try:
+        return api_get(f"/api/videos{query}").get("total", 0)
+    except Exception:
+        return 0
+
+
+@st.cache_data(ttl=30)
+def list_recent_videos() -> List[dict]:
+    # One page (page_size is clamped to 200), cached so the 1.5 s processing
+    # auto-refresh doesn't re-download the listing; older videos are reached
+    # through the manual Video ID input.
+    return api_get("/api/videos?page_size=200").get("items", [])
+
+
 def api_post_video(video_file, voice_file, interval_sec: int):
     files = {"video_file": video_file}
     if voice_file is not None:
@@ -43,16 +60,32 @@ def api_post_video(video_file, voice_file, interval_sec: int):
     return res.json()
 
 
+@st.fragment
+def frames_gallery(video_id: str):
+    # Paging only reruns this fragment, not the video list/detail/status fetches.
+    st.subheader("Frames")
+    page_num = st.number_input("Page", min_value=1, value=1)
+    page_size = st.number_input("Page size", min_value=1, max_value=50, value=12)
+    frames = api_get(
+        f"/api/videos/{video_id}/frames?page={int(page_num)}&page_size={int(page_size)}"
+    )
+    cols = st.columns(3)
+    for idx, frame in enumerate(frames.get("items", [])):
+        with cols[idx % 3]:
+            # One element per frame: st.image renders the caption itself.
+            st.image(
+                f"{API_BASE}{frame['image_url']}",
+                caption=f"{frame['timestamp_sec']}s",
+                use_column_width=True,
+            )
+
+
 if page == "Home":
     st.title("Entity Indexing")
     st.caption("Unified intelligence layer across your video archive.")
-    try:
-        videos = api_get("/api/videos")
-    except Exception:
-        videos = []
-    total = len(videos)
-    completed = len([v for v in videos if v.get("status") == "completed"])
-    processing = len([v for v in videos if v.get("status") == "processing"])
+    total = count_videos()
+    completed = count_videos("completed")
+    processing = count_videos("processing")
 
     col1, col2, col3 = st.columns(3)
     col1.metric("Total Videos", total)
@@ -65,13 +98,18 @@ if page == "Home":
 
 elif page == "Videos Library":
     st.title("Videos Library")
+    # Let the API page the table so only one page of rows is fetched and rendered.
+    page_num = st.number_input("Page", min_value=1, value=1)
+    page_size = st.number_input("Rows per page", min_value=10, max_value=200, value=50)
     try:
-        videos = api_get("/api/videos")
+        listing = api_get(f"/api/videos?page={int(page_num)}&page_size={int(page_size)}")
     except Exception:
-        videos = []
+        listing = {}
+    videos = listing.get("items", [])
     if not videos:
         st.info("No videos found.")
     else:
+        st.caption(f"{listing.get('total', len(videos))} videos")
         st.dataframe(videos, use_container_width=True)
 
 elif page == "Upload":
@@ -96,15 +134,20 @@ elif page == "Upload":
 elif page == "Video Details":
     st.title("Video Details")
     try:
-        videos = api_get("/api/videos")
+        videos = list_recent_videos()
     except Exception:
         videos = []
 
     video_id: Optional[str] = None
     if videos:
-        video_id = st.selectbox("Select video", [v["video_id"] for v in videos])
-    else:
-        video_id = st.text_input("Video ID")
+        # Pass the records straight through; format_func labels them without
+        # building a separate id list on every rerun.
+        selected = st.selectbox("Select video", videos, format_func=lambda v: v["video_id"])
+        video_id = selected["video_id"] if selected else None
+    # Keep the manual ID input for videos outside the listed page.
+    manual_id = st.text_input("Video ID")
+    if manual_id:
+        video_id = manual_id.strip()
 
     if video_id:
         try:
@@ -127,24 +170,14 @@ elif page == "Video Details":
         auto_refresh = st.checkbox("Auto refresh", value=True)
         if auto_refresh and status.get("status") not in {"completed", "failed"}:
             time.sleep(1.5)
-            st.experimental_rerun()
+            st.rerun()
 
         if detail.get("report_available"):
             st.subheader("Report Summary")
             report = detail.get("report") or {}
             st.json(report)
 
-            st.subheader("Frames")
-            page_num = st.number_input("Page", min_value=1, value=1)
-            page_size = st.number_input("Page size", min_value=1, max_value=50, value=12)
-            frames = api_get(
-                f"/api/videos/{video_id}/frames?page={int(page_num)}&page_size={int(page_size)}"
-            )
-            cols = st.columns(3)
-            for idx, frame in enumerate(frames.get("frames", [])):
-                with cols[idx % 3]:
-                    st.image(f"{API_BASE}{frame['url']}", use_column_width=True)
-                    st.caption(f"{frame['timestamp_sec']}s")
+            frames_gallery(video_id)
 
 elif page == "Unified Entity Search":
     st.title("Unified Entity Search")
@@ -154,6 +187,11 @@ elif page == "Unified Entity Search":
     min_frames = st.number_input("Minimum frames", min_value=0, value=0)
 
     if st.button("Search", type="primary") and q:
+        # One-character queries match almost everything and still cost an
+        # embedding pass on the API; don't send them.
+        if len(q.strip()) < 2:
+            st.caption("Type at least 2 characters to search.")
+            st.stop()
         try:
             params = (
                 f"?q={q}&similarity={similarity}&min_presence={min_presence}&min_frames={min_frames}"
@@ -5,11 +5,13 @@ import re
 import shutil
 import subprocess
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 ALLOWED_VIDEO_EXTS = [".mp4", ".mkv", ".avi", ".mov"]
 VIDEO_ID_RE = re.compile(r"^video_(\d+)$", re.IGNORECASE)
+VOICE_FILE_RE = re.compile(r"voice_(\d+)\.txt$")
 
 
 def find_pairs(data_dir: Path) -> List[Dict[str, str]]:
@@ -26,7 +28,7 @@ def find_pairs(data_dir: Path) -> List[Dict[str, str]]:
     voice_files = sorted(data_dir.glob("voice_*.txt"))
 
     for voice_file in voice_files:
-        match = re.match(r"voice_(\d+)\.txt$", voice_file.name)
+        match = VOICE_FILE_RE.match(voice_file.name)
         if not match:
             continue
         pair_id = match.group(1)
@@ -57,9 +59,18 @@ def find_videos(data_dir: Path) -> List[Dict[str, str]]:
     Returns a list of dicts with pair_id (if parsed) and video_path.
     """
     data_dir = Path(data_dir)
-    if not data_dir.exists():
+    try:
+        mtime_ns = data_dir.stat().st_mtime_ns
+    except OSError:
         return []
+    # Adding, removing or renaming a file bumps the directory mtime, so the
+    # cached listing is reused only while the directory is unchanged.
+    return [dict(video) for video in _list_videos(str(data_dir), mtime_ns)]
+
 
+@lru_cache(maxsize=8)
+def _list_videos(data_dir_str: str, mtime_ns: int) -> Tuple[Dict[str, str], ...]:
+    data_dir = Path(data_dir_str)
     videos: List[Dict[str, str]] = []
     for ext in ALLOWED_VIDEO_EXTS:
         for video_file in sorted(data_dir.glob(f"*{ext}")):
@@ -75,7 +86,7 @@ def find_videos(data_dir: Path) -> List[Dict[str, str]]:
             )
 
     videos.sort(key=lambda v: (int(v["pair_id"]) if v["pair_id"].isdigit() else 10**9, v["video_path"]))
-    return videos
+    return tuple(videos)
 
 
 def run_pipeline(
@@ -90,6 +101,9 @@ def run_pipeline(
 ) -> Tuple[int, str, Dict[str, str]]:
     """
     Run the CLI pipeline and return (returncode, logs_text, produced_files).
+
+    log_callback, if given, is called as log_callback(line) with each new
+    output line; the full log is only returned once the process exits.
     """
     root_dir = Path(__file__).resolve().parents[1]
     data_dir = Path(data_dir)
@@ -158,13 +172,15 @@ def run_pipeline(
         text=True,
     )
 
+    # Collect lines and join once at the end; the callback only gets the new
+    # line, so nothing re-copies the accumulated log per line.
     logs: List[str] = []
     if proc.stdout:
-        for line in iter(proc.stdout.readline, ""):
-            logs.append(line)
-            if log_callback:
-                log_callback(line, "".join(logs))
-        proc.stdout.close()
+        with proc.stdout:
+            for line in proc.stdout:
+                logs.append(line)
+                if log_callback:
+                    log_callback(line)
 
     returncode = proc.wait()
     logs_text = "".join(logs)
@@ -186,7 +202,8 @@ def run_pipeline(
         if candidates:
             video_report = max(candidates, key=lambda p: p.stat().st_mtime)
 
-    if video_report and video_report.exists():
+    # Both branches above only pick paths that were just seen on disk.
+    if video_report:
         produced_files["video_report"] = str(video_report)
 
     csv_path = out_dir / "thales_metadata.csv"